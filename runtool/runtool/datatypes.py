@@ -1,6 +1,6 @@
 from functools import partial
+from itertools import chain, product
 from typing import Any, List, Optional, Type, Union, Iterable
-from collections import UserDict, UserList
 
 
 class DotDict(dict):
@@ -11,19 +11,43 @@ class DotDict(dict):
     >>> dotdict = DotDict({"a":{"b":"hello"}})
     >>> dotdict.a.b
     'hello'
+
+    >>> dotdict.b = 1
+    >>> dotdict["b"]
+    1
+
+    Nested dicts which are shared in the source data are shared in the
+    resulting `DotDict` as well.
+
+    >>> shared = {"image": "1"}
+    >>> dotdict = DotDict({"a": shared, "b": shared})
+    >>> dotdict.a is dotdict.b
+    True
     """
 
     __getattr__ = dict.__getitem__
     __setattr__ = dict.__setitem__
     __delattr__ = dict.__delitem__
 
-    def __init__(self, init_data: dict = {}):
+    def __init__(
+        self, init_data: Optional[dict] = None, _memo: Optional[dict] = None
+    ):
+        if init_data is None:
+            return
+
+        # maps id(source dict) -> DotDict, so that a dict which occurs
+        # several times in `init_data` is only converted once
+        memo = {} if _memo is None else _memo
+        memo[id(init_data)] = self
+
         for key, value in init_data.items():
-            if hasattr(value, "keys"):
+            if isinstance(value, dict):
                 if isinstance(value, DotDict):
                     self[key] = value
+                elif id(value) in memo:
+                    self[key] = memo[id(value)]
                 else:
-                    self[key] = DotDict(value)
+                    self[key] = DotDict(value, memo)
             else:
                 self[key] = value
 
@@ -43,18 +67,27 @@ class DotDict(dict):
         <class 'dict'>
         """
 
-        def convert(value: Any) -> Any:
-            if isinstance(value, DotDict):
-                return value.as_dict()
-            elif isinstance(value, list):
-                return list(map(convert, value))
-            else:
-                return value
+        result = {}
 
-        return {key: convert(value) for key, value in self.items()}
+        # each entry is a (target, source) pair where target is the
+        # container which the converted children of source are written to
+        stack = [(result, dict.items(self))]
+        while stack:
+            target, items = stack.pop()
+            for key, value in items:
+                if isinstance(value, DotDict):
+                    converted = {}
+                    stack.append((converted, dict.items(value)))
+                elif isinstance(value, list):
+                    converted = [None] * len(value)
+                    stack.append((converted, enumerate(value)))
+                else:
+                    converted = value
+                target[key] = converted
+        return result
 
 
-class ListNode(UserList):
+class ListNode(list):
     """
     A `ListNode` is a python list which can be added and multiplied
     with other `Node` and `ListNode` objects.
@@ -131,18 +164,40 @@ class ListNode(UserList):
     True
     """
 
+    __slots__ = ()
+
     def __repr__(self) -> str:
         child_names = ", ".join([str(child) for child in self])
         return f"{type(self).__name__}([{child_names}])"
 
+    def __getitem__(self, index):
+        """
+        Slicing returns a `ListNode` of the same type as `self`.
+
+        >>> ListNode([Node({"a": 1}), Node({"b": 2})])[1:]
+        ListNode([Node({'b': 2})])
+        """
+        if isinstance(index, slice):
+            return type(self)(list.__getitem__(self, index))
+        return list.__getitem__(self, index)
+
+    def __rmul__(self, n: int) -> "ListNode":
+        """
+        Repeats the items of `self`, returning a `ListNode` of the same type.
+
+        >>> 2 * ListNode([Node({"a": 1})])
+        ListNode([Node({'a': 1}), Node({'a': 1})])
+        """
+        return type(self)(list.__mul__(self, n))
+
     def __add__(self, other: Union["Node", "ListNode"]) -> Any:
         """
         Returns a new `ListNode` (or any subclass) with `other` appended to `self`.
         """
         if isinstance(other, type(self)):
-            return type(self)(list(self) + list(other))
+            return type(self)(chain(self, other))
         elif isinstance(other, Node):
-            return type(self)(list(self) + [other])
+            return type(self)(chain(self, [other]))
 
         raise TypeError
 
@@ -158,8 +213,7 @@ class ListNode(UserList):
             return Experiments(
                 [
                     Experiment.from_nodes(node_1, node_2)
-                    for node_1 in self
-                    for node_2 in other
+                    for node_1, node_2 in product(self, other)
                 ]
             )
         elif isinstance(other, Node):
@@ -193,16 +247,32 @@ class Experiments(ListNode):
     <class 'runtool.datatypes.Experiments'>
     """
 
+    __slots__ = ()
+
     def __init__(
         self, experiments: Union[Iterable[dict], Iterable["Experiment"]]
     ):
-        if not self.verify(experiments):
-            raise TypeError
-
+        # items are verified while the list is built, such that any
+        # iterable, including iterators, can be used to create Experiments
         super().__init__(
             item if isinstance(item, Experiment) else Experiment(item)
             for item in experiments
         )
+        if not self:
+            raise TypeError
+
+    @classmethod
+    def _from_verified(cls, experiments: List["Experiment"]) -> "Experiments":
+        """
+        Creates an `Experiments` object from a list of `Experiment` objects
+        by copying the list directly, without checking the items.
+        As in `__init__`, a TypeError is raised if the list is empty.
+        """
+        if not experiments:
+            raise TypeError
+        instance = cls.__new__(cls)
+        list.__init__(instance, experiments)
+        return instance
 
     @classmethod
     def verify(cls, data: Iterable) -> bool:
@@ -210,8 +280,14 @@ class Experiments(ListNode):
         Check if the data has the correct structure to instantiate an
         experiment. Any iterable containing valid `Experiment` objects
         are valid `Experiments` object.
+
+        Items which already are `Experiment` objects were verified when
+        they were created and are not verified again.
         """
-        return data and all(map(Experiment.verify, data))
+        return data and all(
+            isinstance(item, Experiment) or Experiment.verify(item)
+            for item in data
+        )
 
     __mul__ = None  # Experiments cannot be multiplied
 
@@ -270,8 +346,9 @@ class Datasets(ListNode):
     True
 
     Upon instantiating a `Datasets` object with an iterable
-    the Datasets.verify method checks that the iterable has the
-    correct structure. If it does not, a TypeError is raised.
+    each item is converted to a `Dataset`, which checks that the item
+    has the correct structure. If it does not, or if the iterable is
+    empty, a TypeError is raised.
 
     >>> Datasets([Dataset({"smth": 1})])
     Traceback (most recent call last):
@@ -282,10 +359,15 @@ class Datasets(ListNode):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, iterable: Iterable):
-        if not self.verify(iterable):
+        super().__init__(
+            item if isinstance(item, Dataset) else Dataset(item)
+            for item in iterable
+        )
+        if not self:
             raise TypeError
-        super().__init__(map(Dataset, iterable))
 
     @classmethod
     def verify(cls, data: Iterable) -> bool:
@@ -295,6 +377,20 @@ class Datasets(ListNode):
         """
         return data and all(map(Dataset.verify, data))
 
+    def __mul__(self, other: Union["Node", "ListNode"]) -> "Experiments":
+        """
+        The items of `Datasets` and `Algorithms` are already known to be
+        valid, thus the experiments can be created without verifying them.
+        """
+        if isinstance(other, Algorithms):
+            return Experiments._from_verified(
+                [
+                    Experiment._from_typed(algorithm, dataset)
+                    for dataset, algorithm in product(self, other)
+                ]
+            )
+        return super().__mul__(other)
+
 
 class Algorithms(ListNode):
     """
@@ -350,8 +446,9 @@ class Algorithms(ListNode):
     True
 
     Upon instantiating a `Algorithms` object with an iterable
-    the Algorithms.verify method checks that the iterable has the
-    correct structure. If it does not, a TypeError is raised.
+    each item is converted to a `Algorithm`, which checks that the item
+    has the correct structure. If it does not, or if the iterable is
+    empty, a TypeError is raised.
 
     >>> Algorithms([{"a": "1"}])
     Traceback (most recent call last):
@@ -362,12 +459,16 @@ class Algorithms(ListNode):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, data):
-        if not self.verify(data):
+        super().__init__(
+            item if isinstance(item, Algorithm) else Algorithm(item)
+            for item in data
+        )
+        if not self:
             raise TypeError
 
-        super().__init__(map(Algorithm, data))
-
     @classmethod
     def verify(cls, data: Iterable) -> bool:
         """
@@ -376,8 +477,22 @@ class Algorithms(ListNode):
         """
         return data and all(map(Algorithm.verify, data))
 
+    def __mul__(self, other: Union["Node", "ListNode"]) -> "Experiments":
+        """
+        The items of `Algorithms` and `Datasets` are already known to be
+        valid, thus the experiments can be created without verifying them.
+        """
+        if isinstance(other, Datasets):
+            return Experiments._from_verified(
+                [
+                    Experiment._from_typed(algorithm, dataset)
+                    for algorithm, dataset in product(self, other)
+                ]
+            )
+        return super().__mul__(other)
+
 
-class Node(UserDict):
+class Node(dict):
     """
     A `Node` is a dictionary which can be added and multiplied with
     `Node` and `ListNode` objects.
@@ -412,11 +527,22 @@ class Node(UserDict):
         `Dataset` for examples of multiplication of `Node` objects.
     """
 
+    __slots__ = ()
+
     # This variable determines what datatype __add__ returns
     result_type: Iterable = ListNode
 
     def __repr__(self) -> str:
-        return f"{type(self).__name__}({dict(self)})"
+        return f"{type(self).__name__}({super().__repr__()})"
+
+    def copy(self) -> "Node":
+        """
+        Returns a shallow copy of the same type as `self`.
+
+        >>> Node({"a": 1}).copy()
+        Node({'a': 1})
+        """
+        return type(self)(self)
 
     def __mul__(self, other) -> "Experiments":
         """
@@ -442,7 +568,7 @@ class Node(UserDict):
         if isinstance(other, type(self)):
             return self.result_type([self, other])
         elif isinstance(other, self.result_type):
-            return self.result_type([self]) + other
+            return self.result_type(chain([self], other))
 
         raise TypeError
 
@@ -488,6 +614,8 @@ class Algorithm(Node):
     True
     """
 
+    __slots__ = ()
+
     # __add__ returns an Algorithms object
     result_type = Algorithms
 
@@ -579,6 +707,8 @@ class Dataset(Node):
     Dataset({'path': {}})
     """
 
+    __slots__ = ()
+
     # __add__ should return a Datasets object
     result_type = Datasets
 
@@ -624,6 +754,8 @@ class Experiment(Node):
     is raised.
     """
 
+    __slots__ = ()
+
     # __add__ should return an Experiments object
     result_type = Experiments
 
@@ -642,18 +774,34 @@ class Experiment(Node):
         If not exactly one node is a valid Dataset and one exactly node
         is a valid Algorithm this raises a TypeError.
         """
-        try:
+        # nodes which already are an Algorithm or a Dataset are known to be
+        # valid, so only untyped nodes need to be verified
+        if isinstance(node_1, Algorithm) and isinstance(node_2, Dataset):
+            return cls._from_typed(node_1, node_2)
+        if isinstance(node_1, Dataset) and isinstance(node_2, Algorithm):
+            return cls._from_typed(node_2, node_1)
+
+        if Algorithm.verify(node_1) and Dataset.verify(node_2):
             return cls({"algorithm": node_1, "dataset": node_2})
-        except TypeError:
-            pass
-
-        try:
+        if Algorithm.verify(node_2) and Dataset.verify(node_1):
             return cls({"algorithm": node_2, "dataset": node_1})
-        except TypeError:
-            raise TypeError(
-                "An Experiment requires one Dataset and one Algorithm, got: "
-                f"{node_1} and {node_2}"
-            )
+
+        raise TypeError(
+            "An Experiment requires one Dataset and one Algorithm, got: "
+            f"{node_1} and {node_2}"
+        )
+
+    @classmethod
+    def _from_typed(
+        cls, algorithm: "Algorithm", dataset: "Dataset"
+    ) -> "Experiment":
+        """
+        Creates an `Experiment` from an `Algorithm` and a `Dataset` which
+        have already been verified, skipping `Experiment.verify`.
+        """
+        experiment = cls.__new__(cls)
+        dict.__init__(experiment, algorithm=algorithm, dataset=dataset)
+        return experiment
 
     @classmethod
     def verify(cls, data: dict) -> bool:
@@ -1,6 +1,9 @@
-from functools import singledispatch
 import itertools
-from typing import Callable, Any
+from typing import Any, Callable, List, Tuple, Union
+
+# types of the scalar values which occur in a config, these can never
+# contain nested nodes and are checked before the slower isinstance call
+_LEAF_TYPES = frozenset({str, int, float, bool, type(None)})
 
 
 class Versions:
@@ -13,6 +16,10 @@ class Versions:
     Versions([1, 2, 3])
     """
 
+    # many Versions objects are created while merging nodes,
+    # slots avoid a __dict__ for each of them
+    __slots__ = ("__root__",)
+
     def __init__(self, versions: list = None):
         self.__root__ = versions if versions else []
 
@@ -39,7 +46,6 @@ class Versions:
         self.__root__.append(data)
 
 
-@singledispatch
 def recursive_apply(node, fn: Callable) -> Any:
     """
     Applies a function to `dict` nodes in a JSON-like structure.
@@ -121,89 +127,144 @@ def recursive_apply(node, fn: Callable) -> Any:
     Any
         Depends on how `fn` transforms the node.
     """
-    return node
+    if type(node) in _LEAF_TYPES or not isinstance(node, (dict, list)):
+        return node
+
+    # The tree is traversed in post-order using an explicit stack instead
+    # of recursion, see `_frame` for the contents of each stack frame.
+    stack = [_frame(None, node)]
+    while True:
+        key, children, merge, processed = stack[-1]
+        for child_key, child in children:
+            if type(child) not in _LEAF_TYPES and isinstance(
+                child, (dict, list)
+            ):
+                # process the child before continuing with the container
+                stack.append(_frame(child_key, child))
+                break
+            processed.append((child_key, child))
+        else:
+            # all children of the container have been processed
+            stack.pop()
+            result = merge(processed, fn)
+            if not stack:
+                return result
+            stack[-1][3].append((key, result))
 
 
-@recursive_apply.register
 def recursive_apply_dict(node: dict, fn: Callable) -> Any:
     """
-    Applies `fn` to the node, if `fn` changes the node,
-    the changes should be returned. If the `fn` does not change the node,
-    it calls `recursive_apply` on the children of the node.
+    Applies `recursive_apply` to a `dict` node, see `_merge_dict` for how
+    the processed children of the node are combined.
+    """
+    return recursive_apply(node, fn)
+
+
+def recursive_apply_list(node: list, fn: Callable) -> Any:
+    """
+    Applies `recursive_apply` to a `list` node, see `_merge_list` for how
+    the processed children of the node are combined.
+    """
+    return recursive_apply(node, fn)
 
-    In case the recursion on the children results in one or more
-    `runtool.datatypes.Versions` objects, the cartesian product of these
-    versions is calculated and a new `runtool.datatypes.Versions` object will be
-    returned containing the different versions of this node.
+
+def _frame(key: Any, node: Union[dict, list]) -> tuple:
+    """
+    Creates the stack frame used by `recursive_apply` to process `node`.
+    The type of the node is only checked here, a frame consists of:
+
+    - the key of the node in its parent
+    - an iterator over the (key, value) pairs of a `dict` node
+      or the (index, value) pairs of a `list` node
+    - the function which merges the processed children of the node
+    - the processed (key, value) pairs of the node so far
+    """
+    if isinstance(node, dict):
+        return key, iter(node.items()), _merge_dict, []
+    return key, enumerate(node), _merge_list, []
+
+
+def _merge_dict(children: List[Tuple[Any, Any]], fn: Callable) -> Any:
+    """
+    Applies `fn` to the node made up of the processed `children`,
+    if `fn` changes the node, the changes should be returned.
+
+    In case one or more children are `runtool.datatypes.Versions` objects,
+    the cartesian product of these versions is calculated, `fn` is applied
+    to each resulting node and a new `runtool.datatypes.Versions` object
+    will be returned containing the different versions of this node.
 
     """
 
     # else merge children of type Versions into a new Versions object
-    expanded_children = []
+    versioned_keys = []
+    versions = []
     new_node = {}
-    for key, value in node.items():
-        child = recursive_apply(value, fn)
-        # If the child is a Versions object, map the key to all its versions,
-        # child = Versions([1,2]),
-        # key = ['a']
-        # ->
-        # (('a':1), ('a':2))
+    for key, child in children:
+        # If the child is a Versions object, remember the key together
+        # with the versions that it can take.
         if isinstance(child, Versions):
-            expanded_children.append(itertools.product([key], child))
+            versioned_keys.append(key)
+            versions.append(child)
         else:
             new_node[key] = child
-    if expanded_children:
+    if versions:
         # example:
-        # expanded_children = [(('a':1), ('a':2)), (('b':1), ('b':2))]
+        # versioned_keys = ['a', 'b']
+        # versions = [Versions([1, 2]), Versions([1, 2])]
         # new_node = {"c": 3}
         # results in:
         # [
         #   {'a':1, 'b':1, 'c':3},
         #   {'a':1, 'b':2, 'c':3},
         #   {'a':2, 'b':1, 'c':3},
-        #   {'a':3, 'b':2, 'c':3},
+        #   {'a':2, 'b':2, 'c':3},
         # ]
-        new_node = [
-            fn(
-                dict(version_of_node, **new_node)
-            )  # apply fn to the new version of the node
-            for version_of_node in itertools.product(*expanded_children)
-        ]
+        static_items = new_node
+        new_node = []
+        all_versions = True
+        for values in itertools.product(*versions):
+            version_of_node = dict(zip(versioned_keys, values))
+            version_of_node.update(static_items)
+            # apply fn to the new version of the node
+            result = fn(version_of_node)
+            all_versions = all_versions and isinstance(result, Versions)
+            new_node.append(result)
 
         # if the current node generated Versions object, these
         # need to be flattened as well. For example:
         # new_node = [Versions([1,2]), Versions([3,4])]
         # results in
         # Versions([[1,3], [1,4], [2,3], [2,4]])
-        if all(isinstance(val, Versions) for val in new_node):
+        if all_versions:
             return Versions(list(*itertools.product(*new_node)))
         return Versions(new_node)
     return fn(new_node)
 
 
-@recursive_apply.register
-def recursive_apply_list(node: list, fn: Callable) -> Any:
+def _merge_list(children: List[Tuple[int, Any]], fn: Callable) -> Any:
     """
-    Calls `recursive_apply` on each element in the node, without applying `fn`.
-    Calculates the cartesian product of any `runtool.datatypes.Versions` objects
-    in the nodes children. From this a new `runtool.datatypes.Versions`object is
-    generated representing the different variants that this node can take.
+    Builds a list from the processed `children`, without applying `fn`.
+    Calculates the cartesian product of any `runtool.datatypes.Versions`
+    objects in the children. From this a new `runtool.datatypes.Versions`
+    object is generated representing the different variants that this
+    node can take.
 
     NOTE::
         The indexes of the node are maintained throughout this process.
     """
     versions_in_children = []
-    child_normal = [None] * len(node)  # maintans indexes
-    for index, value in enumerate(node):
-        child = recursive_apply(value, fn)
+    # children are ordered by index, the Versions objects in child_normal
+    # are overwritten with their values below, thus maintaining the indexes
+    child_normal = []
+    for index, child in children:
         if isinstance(child, Versions):
             # child = Versions([1,2])
             # ->
             # expanded_child_version = ((index, 1), (index, 2))
             expanded_child_version = itertools.product([index], child)
             versions_in_children.append(expanded_child_version)
-        else:
-            child_normal[index] = child
+        child_normal.append(child)
 
     if not versions_in_children:
         return child_normal
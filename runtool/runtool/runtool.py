@@ -14,6 +14,8 @@ from runtool.datatypes import (
     DotDict,
     Experiment,
     Experiments,
+    ListNode,
+    Node,
 )
 from runtool.recurse_config import Versions
 from runtool.transformer import apply_transformations
@@ -29,6 +31,19 @@ def infer_type(node):
     return node
 
 
+@infer_type.register(Node)
+@infer_type.register(ListNode)
+def infer_type_node(node: Union[Node, ListNode]) -> Union[Node, ListNode]:
+    """
+    Nodes which already have a type are returned unaltered.
+
+    >>> algorithm = Algorithm({"image": "image_name", "instance": "ml.m5"})
+    >>> infer_type(algorithm) is algorithm
+    True
+    """
+    return node
+
+
 @infer_type.register
 def infer_type_list(
     node: list,
@@ -2,7 +2,7 @@ import itertools
 import math
 import re
 import json
-from functools import partial
+from functools import lru_cache
 from typing import Any, Callable, Tuple
 from uuid import uuid4
 
@@ -11,6 +11,39 @@ from runtool.utils import get_item_from_path, update_nested_dict
 from runtool.recurse_config import recursive_apply, Versions
 
 
+# matches any parts of a $eval text which is similar to this:
+# $.somestring.somotherstring[0]['a_key']["some_key"]
+_EVAL_REGEX = re.compile(
+    r"""
+        (\$                         # match string starting with $ and followed by:
+            (?:
+                \[[\d]+\]|          # digits enclosed in [] i.e. $[0]
+                \[\"[\w_\d$]+\"\]|  # words or digits in "[]" i.e. $["0"]
+                \[\'[\w_\d$]+\'\]|  # words or digits in '[]' i.e. $['0']
+                \.[\w_\d]+          # words or digits prepended with a dot, i.e. $.hello
+            )+
+        )
+    """,
+    flags=re.VERBOSE,
+)
+
+# matches any parts of a $eval text which is similar to this:
+# __trial__.somestring.somotherstring[0]['a_key']["some_key"]
+_TRIAL_REGEX = re.compile(
+    r"""
+        (__trial__
+            (?:
+                \[[\d]+\]|          # digits enclosed in [] i.e. __trial__[0]
+                \[\"[\w_\d$]+\"\]|  # words or digits in "[]" i.e. __trial__["0"]
+                \[\'[\w_\d$]+\'\]|  # words or digits in '[]' i.e. __trial__['0']
+                \.\w+[\w_\d]*       # words or digits prepended with a dot, i.e. __trial__.hell0
+            )+
+        )
+    """,
+    flags=re.VERBOSE,
+)
+
+
 def apply_from(node: dict, context: dict) -> dict:
     """
     Update the node with the data which the path in node['$from'] is pointing to in the context dictionary.
@@ -25,7 +58,8 @@ def apply_from(node: dict, context: dict) -> dict:
     Parameters
     ----------
     node
-        The node which should be processed.
+        The dict node which should be processed, `recursive_apply` only
+        passes dict nodes to this function.
     context:
         Data which can be referenced by the path in node["$from"].
     Returns
@@ -33,14 +67,14 @@ def apply_from(node: dict, context: dict) -> dict:
     Dict
         the `node` updated with values from `context[node["from"]]`
     """
-    if not (isinstance(node, dict) and "$from" in node):
+    if "$from" not in node:
         return node
 
     source = get_item_from_path(context, node.pop("$from"))
 
     # resolve any $from in the node we inherit from
     # this is to avoid updating the node with a new $from
-    source = recursive_apply(source, partial(apply_from, context=context))
+    source = recursive_apply(source, lambda item: apply_from(item, context))
 
     assert isinstance(
         source, dict
@@ -75,7 +109,8 @@ def apply_ref(node: dict, context: dict) -> Any:
     Parameters
     ----------
     node
-        The node which should be processed.
+        The dict node which should be processed, `recursive_apply` only
+        passes dict nodes to this function.
     context
         The data which can be referenced using $ref
     Returns
@@ -83,12 +118,45 @@ def apply_ref(node: dict, context: dict) -> Any:
     Any
         The data which is referenced
     """
-    if not (isinstance(node, dict) and "$ref" in node):
+    if "$ref" not in node:
         return node
 
     assert len(node) == 1, "$ref needs to be the only value"
     data = get_item_from_path(context, node["$ref"])
-    return recursive_apply(data, partial(apply_ref, context=context))
+    return recursive_apply(data, lambda item: apply_ref(item, context))
+
+
+@lru_cache(maxsize=4096)
+def _compile_expression(expression: str):
+    """
+    Compile `expression` into a code object for `eval`, caching the result
+    so that recurring expressions are only parsed once.
+    """
+    return compile(expression, "<runtool-eval>", "eval")
+
+
+class _EvalLocals(dict):
+    """
+    The locals of a single `eval` call, backed by a `DotDict` which is shared
+    between calls. A name is copied from the shared `DotDict` the first time
+    the expression reads it, nested dicts are copied as well. Thus, names
+    assigned or dicts mutated by one expression are not seen by the next one.
+    Lists which are direct values of the shared `DotDict` are not copied.
+    """
+
+    __slots__ = ("_shared",)
+
+    def __init__(self, shared: DotDict):
+        super().__init__()
+        self._shared = shared
+
+    def __missing__(self, key: str) -> Any:
+        # a KeyError makes eval look the name up in the globals instead
+        value = self._shared[key]
+        if isinstance(value, DotDict):
+            value = DotDict(value.as_dict())
+        self[key] = value
+        return value
 
 
 def evaluate(expression: str, locals: dict) -> Any:
@@ -109,16 +177,48 @@ def evaluate(expression: str, locals: dict) -> Any:
         The expression which should be evaluated
     locals
         The locals parameter to the `eval` function in the standard library.
+        Nested dicts are made accessible as attributes by wrapping `locals`
+        in a `DotDict`, passing a `DotDict` avoids this conversion. The
+        expression cannot modify `locals`, see `_EvalLocals`.
     Returns
     -------
     Any
         The value after applying `eval` to the expression.
     """
-    return eval(
-        expression,
-        dict(uid=str(uuid4()).split("-")[-1]),
-        dict(DotDict(locals)),
-    )
+    # uid is intentionally generated on each call so that every evaluated
+    # expression gets a unique id, it is skipped for expressions which
+    # cannot reference it
+    globals = {}
+    if "uid" in expression:
+        globals["uid"] = str(uuid4()).split("-")[-1]
+    if isinstance(locals, DotDict):
+        locals = _EvalLocals(locals)
+    else:
+        locals = DotDict(locals)
+    return eval(_compile_expression(expression), globals, locals)
+
+
+# removes brackets and double quotes from a path segment such as ["key"]
+_STRIP_BRACKETS = str.maketrans("", "", '[]"')
+
+
+@lru_cache(maxsize=2048)
+def _parse_path(path: str) -> Tuple[Tuple[str, str], ...]:
+    """
+    Splits a path used by `recurse_eval` into `(segment, key)` pairs, where
+    `segment` is the part of the path as written and `key` is what the data
+    is indexed with. The result is cached as the same paths recur often.
+
+    >>> _parse_path('a.b[0]["c"]')
+    (('a', 'a'), ('b', 'b'), ('[0]', '0'), ('["c"]', 'c'))
+    """
+    segments = []
+    for segment in path.replace("[", ".[").split("."):
+        key = segment
+        if "[" in key:
+            key = key.translate(_STRIP_BRACKETS)
+        segments.append((segment, key))
+    return tuple(segments)
 
 
 def recurse_eval(path: str, data: dict, fn: Callable) -> Tuple[str, Any]:
@@ -153,22 +253,18 @@ def recurse_eval(path: str, data: dict, fn: Callable) -> Tuple[str, Any]:
     """
     tmp = data
     current_path = []
-    path = path.replace("[", ".[")
-    for key in path.split("."):
-        original_key = key
-        if "[" in key:
-            key = key.replace("[", "").replace("]", "").replace('"', "")
-        try:
+    for original_key, key in _parse_path(path):
+        if isinstance(tmp, dict):
+            if key not in tmp:
+                break
             tmp = tmp[key]
-            current_path.append(original_key)
-        except TypeError:
+        else:
+            # lists and other sequences are indexed by position
             try:
                 tmp = tmp[int(key)]
-                current_path.append(original_key)
-            except ValueError:
+            except (ValueError, TypeError, IndexError):
                 break
-        except:
-            break
+        current_path.append(original_key)
     return ".".join(current_path).replace(".[", "["), fn(tmp, data)
 
 
@@ -221,22 +317,9 @@ def apply_eval(node: dict, locals: dict) -> Any:
     text = str(node["$eval"])
     text = text.replace("$trial", "__trial__")
 
-    # matches any parts of the text which is similar to this:
-    # $.somestring.somotherstring[0]['a_key']["some_key"]
-    regex = r"""
-        (\$                         # match string starting with $ and followed by:
-            (?:
-                \[[\d]+\]|          # digits enclosed in [] i.e. $[0]
-                \[\"[\w_\d$]+\"\]|  # words or digits in "[]" i.e. $["0"]
-                \[\'[\w_\d$]+\'\]|  # words or digits in '[]' i.e. $['0']
-                \.[\w_\d]+          # words or digits prepended with a dot, i.e. $.hello
-            )+
-        )
-    """
-
     # replace any matched substrings of the text with whatever the
     # substrings pointed to in the locals parameter
-    for match in re.finditer(regex, text, flags=re.VERBOSE):
+    for match in _EVAL_REGEX.finditer(text):
         path, value = recurse_eval(match[0].lstrip("$."), locals, apply_eval)
         path = f"$.{path}"
         if isinstance(value, dict) and "$eval" in value:
@@ -287,19 +370,8 @@ def apply_trial(node: dict, locals: dict) -> Any:
     assert len(node) == 1, "$eval needs to be only value"
     text = str(node["$eval"])
 
-    regex = r"""
-        (__trial__
-            (?:
-                \[[\d]+\]|          # digits enclosed in [] i.e. __trial__[0]
-                \[\"[\w_\d$]+\"\]|  # words or digits in "[]" i.e. __trial__["0"]
-                \[\'[\w_\d$]+\'\]|  # words or digits in '[]' i.e. __trial__['0']
-                \.\w+[\w_\d]*       # words or digits prepended with a dot, i.e. __trial__.hell0
-            )+
-        )
-    """
-
     # find longest working path for each match in locals
-    for match in re.finditer(regex, text, flags=re.VERBOSE):
+    for match in _TRIAL_REGEX.finditer(text):
         substring, value = recurse_eval(match[0], locals, apply_trial)
 
         if isinstance(value, dict) and "$eval" in value:
@@ -357,14 +429,15 @@ def apply_each(node: dict) -> Versions:
     Parameters
     ----------
     node
-        The node which should have `$each` applied to it.
+        The dict node which should have `$each` applied to it,
+        `recursive_apply` only passes dict nodes to this function.
 
     Returns
     -------
     runtool.datatypes.Versions
         The versions object representing the different values of the node.
     """
-    if not (isinstance(node, dict) and "$each" in node):
+    if "$each" not in node:
         return node
 
     each = node.pop("$each")
@@ -1,5 +1,6 @@
-from functools import partial
+from typing import Any
 
+from runtool.datatypes import DotDict
 from runtool.recurse_config import recursive_apply, Versions
 from runtool.transformations import (
     apply_eval,
@@ -10,6 +11,21 @@ from runtool.transformations import (
 )
 
 
+def _apply_eval_and_each(node: dict, locals: dict) -> Any:
+    """
+    Applies `apply_eval` followed by `apply_each` to a node, this allows
+    both transformations to be done in a single `recursive_apply` pass.
+
+    Any `$each` in the value that a `$eval` evaluates to is expanded as well,
+    as if `apply_each` had been applied in a separate pass. This is only
+    equivalent to separate passes if no `$eval` has a dict or list as its
+    value, as the `$each` nodes within these would be expanded first.
+    """
+    if "$eval" in node:
+        return recursive_apply(apply_eval(node, locals), apply_each)
+    return apply_each(node)
+
+
 def apply_transformations(data: dict) -> list:
     """
     Applies a chain of transformations converting nodes in `data` using
@@ -42,13 +58,40 @@ def apply_transformations(data: dict) -> list:
     list
         the transformed `data` where each item is a version of the data.
     """
-    data = recursive_apply(data, partial(apply_from, context=data))
-    data = recursive_apply(data, partial(apply_eval, locals=data))
-    data = recursive_apply(data, apply_each)
+    # the transformations are bound to their context using lambdas rather
+    # than functools.partial since these are cheaper to call for each node
+    context = data
+    has_container_eval = False
+
+    def from_and_check_eval(node):
+        # a $eval of a dict or list must see any $each within it unexpanded,
+        # which the combined $eval and $each pass cannot guarantee
+        nonlocal has_container_eval
+        node = apply_from(node, context)
+        if isinstance(node, dict) and isinstance(
+            node.get("$eval"), (dict, list)
+        ):
+            has_container_eval = True
+        return node
+
+    data = recursive_apply(data, from_and_check_eval)
+    # convert data to a DotDict once so that `evaluate` does not have to
+    # convert it again for every $eval node
+    eval_locals = DotDict(data)
+    if has_container_eval:
+        data = recursive_apply(
+            data, lambda node: apply_eval(node, eval_locals)
+        )
+        data = recursive_apply(data, apply_each)
+    else:
+        data = recursive_apply(
+            data, lambda node: _apply_eval_and_each(node, eval_locals)
+        )
 
-    data = list(data) if isinstance(data, Versions) else [data]
+    # Versions objects are iterated over directly rather than copied
+    data = data if isinstance(data, Versions) else [data]
     data = [
-        recursive_apply(item, partial(apply_ref, context=item))
+        recursive_apply(item, lambda node: apply_ref(node, item))
         for item in data
     ]
     return data
@@ -1,4 +1,5 @@
-from typing import Union, Any
+from functools import lru_cache
+from typing import Any, Optional, Tuple, Union
 
 
 def get_item_from_path(data: Union[dict, list], path: str) -> Any:
@@ -19,14 +20,41 @@ def get_item_from_path(data: Union[dict, list], path: str) -> Any:
     Any
         The value of `data` at the given `path`
     """
-    for key in path.split("."):
-        try:
+    if "." not in path and isinstance(data, dict):
+        # paths with a single key into a dict need no splitting
+        return data[path]
+
+    for key, index in _split_path(path):
+        if isinstance(data, dict):
             data = data[key]
-        except TypeError:
+        elif index is None:
+            # a non-numeric key cannot index a list, int raises ValueError
             data = data[int(key)]
+        else:
+            data = data[index]
     return data
 
 
+@lru_cache(maxsize=4096)
+def _split_path(path: str) -> Tuple[Tuple[str, Optional[int]], ...]:
+    """
+    Splits a path used by `get_item_from_path` into `(key, index)` pairs,
+    where `key` is used to index dicts and `index` to index lists.
+    `index` is None for keys which are not integers.
+    The result is cached as the same paths are used repeatedly.
+
+    >>> _split_path("hello.3.there")
+    (('hello', None), ('3', 3), ('there', None))
+    """
+    segments = []
+    for key in path.split("."):
+        try:
+            segments.append((key, int(key)))
+        except ValueError:
+            segments.append((key, None))
+    return tuple(segments)
+
+
 def update_nested_dict(data: dict, to_update: dict) -> dict:
     """
     Returns an updated version of the `data` dict updated with any changes from the `to_update` dict.
@@ -53,14 +81,32 @@ def update_nested_dict(data: dict, to_update: dict) -> dict:
     Returns
     -------
     dict
-        The updated dictionary.
+        The updated dictionary. Dicts in `to_update` which do not have
+        to be merged with a dict in `data` are inserted without being
+        copied.
     """
-    for key, value in to_update.items():
-        if isinstance(data, dict):
-            if isinstance(value, dict):
-                data[key] = update_nested_dict(data.get(key, {}), value)
-            else:
-                data[key] = to_update[key]
-        else:
-            data = {key: to_update[key]}
+    if not isinstance(data, dict):
+        if not to_update:
+            return data
+        data = {}
+
+    # The nested dicts are merged using an explicit stack of
+    # (dict to update, dict with updates) pairs instead of recursion.
+    stack = [(data, to_update)]
+    while stack:
+        target, updates = stack.pop()
+        if target.keys().isdisjoint(updates):
+            # nothing needs to be merged, copy all updates at once
+            target.update(updates)
+            continue
+        for key, value in updates.items():
+            if isinstance(value, dict) and key in target:
+                nested = target[key]
+                if isinstance(nested, dict):
+                    stack.append((nested, value))
+                    continue
+                if not value:
+                    # nothing to replace the non dict value with
+                    continue
+            target[key] = value
     return data
@@ -1,9 +1,13 @@
+import copy
+import pickle
+
 import pytest
 from runtool.datatypes import (
     Algorithm,
     Algorithms,
     Dataset,
     Datasets,
+    DotDict,
     Experiment,
     Experiments,
 )
@@ -78,6 +82,24 @@ def test_algorithms_mul_datasets():
     assert ALGORITHMS(2) * DATASETS(2) == EXPERIMENTS(4)
 
 
+def test_algorithms_mul_datasets_shares_nodes():
+    for experiment in ALGORITHMS(2) * DATASETS(2):
+        assert experiment["algorithm"] is ALGORITHM
+        assert experiment["dataset"] is DATASET
+
+
+def test_datatypes_have_no_instance_dict():
+    for item in (
+        ALGORITHM,
+        DATASET,
+        EXPERIMENT,
+        ALGORITHMS(1),
+        DATASETS(1),
+        EXPERIMENTS(1),
+    ):
+        assert not hasattr(item, "__dict__")
+
+
 def test_algorithm_plus_algorithm():
     assert ALGORITHM + ALGORITHM == ALGORITHMS(2)
 
@@ -150,3 +172,56 @@ def test_experiments_mul():
             EXPERIMENTS(2),
         ),
     )
+
+
+
+@pytest.mark.parametrize("data", [ALGORITHMS(2), DATASETS(2), EXPERIMENTS(2)])
+def test_listnode_slice_keeps_type(data):
+    sliced = data[0:1]
+    assert type(sliced) is type(data)
+    assert sliced == type(data)([data[0]])
+
+
+@pytest.mark.parametrize("data", [ALGORITHMS(1), DATASETS(1), EXPERIMENTS(1)])
+def test_listnode_rmul_keeps_type(data):
+    repeated = 2 * data
+    assert type(repeated) is type(data)
+    assert repeated == type(data)([data[0], data[0]])
+
+
+@pytest.mark.parametrize("data", [ALGORITHM, DATASET, EXPERIMENT])
+def test_node_copy_keeps_type(data):
+    copied = data.copy()
+    assert type(copied) is type(data)
+    assert copied == data
+    assert copied is not data
+
+
+def test_multiplying_emptied_listnodes():
+    algorithms = ALGORITHMS(1)
+    algorithms.clear()
+    with pytest.raises(TypeError):
+        algorithms * DATASETS(1)
+    with pytest.raises(TypeError):
+        DATASETS(1) * algorithms
+
+def test_dotdict_copy():
+    dotdict = DotDict({"a": {"b": 1}})
+    copied = copy.copy(dotdict)
+    assert copied == dotdict
+    assert type(copied) is DotDict
+    assert copied.a is dotdict.a
+
+
+def test_dotdict_pickle():
+    dotdict = DotDict({"a": {"b": 1}})
+    unpickled = pickle.loads(pickle.dumps(dotdict))
+    assert unpickled == dotdict
+    assert type(unpickled.a) is DotDict
+
+
+def test_dotdict_key_shadowing_method():
+    dotdict = DotDict({"items": 1, "keys": 2})
+    assert list(dotdict.items()) == [("items", 1), ("keys", 2)]
+    assert list(dotdict.keys()) == ["items", "keys"]
+    assert dotdict["items"] == 1
@@ -1,6 +1,8 @@
 from runtool.datatypes import Dataset, Algorithm, Algorithms, Datasets
+import pytest
 import yaml
 from typing import Union
+from runtool.recurse_config import Versions
 from runtool.runtool import infer_type
 
 ALGORITHM = {
@@ -50,3 +52,21 @@ def test_datasets():
         data={"datasets": [DATASET]},
         expected={"datasets": Datasets([Dataset(DATASET)])},
     )
+
+
+def test_versions_not_inferred():
+    versions = Versions([ALGORITHM])
+    assert infer_type(versions) is versions
+
+
+@pytest.mark.parametrize(
+    "node",
+    [
+        Algorithm(ALGORITHM),
+        Dataset(DATASET),
+        Algorithms([Algorithm(ALGORITHM)]),
+        Datasets([Dataset(DATASET)]),
+    ],
+)
+def test_typed_node_not_inferred(node):
+    assert infer_type(node) is node
@@ -1,26 +1,36 @@
+import copy
 from pathlib import Path
 
 import pytest
 import yaml
 from runtool.transformer import apply_transformations
 
+# use the libyaml based loader when available as it is much faster
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-def assert_config_equal(source, expected):
-    received = apply_transformations(yaml.safe_load(source))
-    assert received == yaml.safe_load(expected)
+_DATA_DIR = Path(__file__).resolve().parent / "test_data"
 
 
-def load(testname):
-    path = Path(__file__).parent / "test_data" / testname
+def assert_config_equal(source, expected):
+    # the source is parsed on each call since the transformations
+    # may modify it, expected can be passed as yaml or as parsed data
+    received = apply_transformations(yaml.load(source, Loader=Loader))
+    if isinstance(expected, str):
+        expected = yaml.load(expected, Loader=Loader)
+    assert received == expected
 
-    expected_path = path / "expected.yml"
-    source_path = path / "source.yml"
 
-    with source_path.open() as source, expected_path.open() as expected:
-        return {
-            "source": source.read(),
-            "expected": expected.read(),
-        }
+@pytest.fixture(scope="session")
+def example(request):
+    """
+    Parses the source and expected configs of the example in the
+    test_data directory named by the test parameter.
+    """
+    path = _DATA_DIR / request.param
+    return tuple(
+        yaml.load((path / name).read_text(encoding="utf-8"), Loader=Loader)
+        for name in ("source.yml", "expected.yml")
+    )
 
 
 def test_from_simple():
@@ -30,11 +40,7 @@ def test_from_simple():
             data: 1
         inherited:
             $from: base""",
-        expected="""
-        - base:
-            data: 1
-          inherited:
-            data: 1""",
+        expected=[{"base": {"data": 1}, "inherited": {"data": 1}}],
     )
 
 
@@ -131,9 +137,7 @@ def test_ref():
             $ref: source
         source: 10
         """,
-        expected="""
-        - ref: 10
-          source: 10""",
+        expected=[{"ref": 10, "source": 10}],
     )
 
 
@@ -182,11 +186,7 @@ def test_each_simple():
         my_each:
             $each: [1,2,3]
         """,
-        expected="""
-        - my_each: 1
-        - my_each: 2
-        - my_each: 3
-        """,
+        expected=[{"my_each": 1}, {"my_each": 2}, {"my_each": 3}],
     )
 
 
@@ -462,9 +462,7 @@ def test_eval():
         base:
             $eval: max(10,2)
         """,
-        expected="""
-        - base: 10
-        """,
+        expected=[{"base": 10}],
     )
 
 
@@ -481,6 +479,48 @@ def test_eval_in_list():
     )
 
 
+def test_eval_assignment_not_shared():
+    assert_config_equal(
+        source="""
+        a: 1
+        x:
+            $eval: (a := 5) and 0
+        y:
+            $eval: a
+        """,
+        expected=[{"a": 1, "x": 0, "y": 1}],
+    )
+
+
+def test_eval_mutation_not_shared():
+    assert_config_equal(
+        source="""
+        d:
+            k: 1
+        x:
+            $eval: d.pop("k", None)
+        y:
+            $eval: d.k
+        """,
+        expected=[{"d": {"k": 1}, "x": 1, "y": 1}],
+    )
+
+
+def test_eval_of_each():
+    # the $each within the value of a $eval is expanded after the $eval,
+    # so the expressions are not evaluated
+    assert_config_equal(
+        source="""
+        x:
+            $eval:
+                $each:
+                    - 1+1
+                    - 2+2
+        """,
+        expected=[{"x": "1+1"}, {"x": "2+2"}],
+    )
+
+
 def test_eval_with_trial():
     assert_config_equal(
         source="""
@@ -620,13 +660,13 @@ def test_eval_indexing_recursive():
     )
 
 
-def test_simple_example():
-    assert_config_equal(**load("simple_example"))
-
-
-def test_large_example():
-    assert_config_equal(**load("large_example"))
-
-
-def test_complex_example():
-    assert_config_equal(**load("complex_example"))
+@pytest.mark.parametrize(
+    "example",
+    ["simple_example", "large_example", "complex_example"],
+    indirect=True,
+)
+def test_example(example):
+    source, expected = example
+    # the parsed source is shared, copy it as the transformations
+    # may modify it
+    assert apply_transformations(copy.deepcopy(source)) == expected
@@ -1,3 +1,6 @@
+import itertools
+
+import pytest
 from runtool.recurse_config import (
     recursive_apply,
     recursive_apply_dict,
@@ -6,181 +9,178 @@ from runtool.recurse_config import (
 )
 
 
+# the conversions done by `transform`, in order of precedence
+TRANSFORMS = {
+    "version": lambda node: Versions(node["version"]),
+    "double": lambda node: 2 * node["double"],
+}
+
+
 def transform(node: dict):
     """
     Converts node to a version object if the node has a key "versions"
     else it multiplies the node by 2 if the node has key "double"
     """
-    if "version" in node:
-        return Versions(node["version"])
-    elif "double" in node:
-        return 2 * node["double"]
+    for key, convert in TRANSFORMS.items():
+        if key in node:
+            return convert(node)
     return node
 
 
-def compare_recursive_apply(node, expected, fn=transform):
-    assert recursive_apply(node, fn) == expected
-
-
-def test_recursive_apply_double_simple():
-    compare_recursive_apply(
-        node={"double": 1},
-        expected=2,
-    )
-
-
-def test_recursive_apply_double_nested():
-    compare_recursive_apply(
-        node={
-            "no_double": 2,
-            "double_this": {"double": 2},
-        },
-        expected={"no_double": 2, "double_this": 4},
-    )
+def identity(node):
+    return node
 
 
-def test_recursive_apply_versions():
-    compare_recursive_apply(
-        node={
-            "my_list": [
-                {"hello": "there"},
-                {"a": {"version": [1, 2]}},
-            ]
-        },
-        expected=Versions(
-            [
-                {"my_list": [{"hello": "there"}, {"a": 1}]},
-                {"my_list": [{"hello": "there"}, {"a": 2}]},
-            ]
+@pytest.mark.parametrize(
+    "node, expected, fn",
+    [
+        pytest.param({"double": 1}, 2, transform, id="double_simple"),
+        pytest.param(
+            {
+                "no_double": 2,
+                "double_this": {"double": 2},
+            },
+            {"no_double": 2, "double_this": 4},
+            transform,
+            id="double_nested",
         ),
-    )
-
-
-def test_recursive_apply_trivial():
-    compare_recursive_apply({}, {})
-
-
-def test_recursive_apply_merging_versions_simple():
-    compare_recursive_apply(
-        node=[Versions([1, 2])],
-        expected=Versions([[1], [2]]),
-        fn=lambda x: x,
-    )
-
-
-def test_recursive_apply_merging_versions_list():
-    compare_recursive_apply(
-        node=[Versions([1, 2]), Versions([3, 4])],
-        expected=Versions([[1, 3], [1, 4], [2, 3], [2, 4]]),
-        fn=lambda x: x,
-    )
-
-
-def test_recursive_apply_merging_versions_dict():
-    compare_recursive_apply(
-        node={"a": Versions([1, 2]), "b": Versions([3, 4])},
-        expected=Versions(
-            [
-                {"a": 1, "b": 3},
-                {"a": 1, "b": 4},
-                {"a": 2, "b": 3},
-                {"a": 2, "b": 4},
-            ]
+        pytest.param(
+            {
+                "my_list": [
+                    {"hello": "there"},
+                    {"a": {"version": [1, 2]}},
+                ]
+            },
+            Versions(
+                [
+                    {"my_list": [{"hello": "there"}, {"a": 1}]},
+                    {"my_list": [{"hello": "there"}, {"a": 2}]},
+                ]
+            ),
+            transform,
+            id="versions",
         ),
-        fn=lambda x: x,
-    )
-
-
-def test_recursive_apply_merging_versions_list_in_dict():
-    compare_recursive_apply(
-        node={
-            "a": [Versions([1, 2]), Versions([3, 4])],
-            "b": [Versions([5, 6]), Versions([7, 8])],
-        },
-        expected=Versions(
-            [
-                {"a": [1, 3], "b": [5, 7]},
-                {"a": [1, 3], "b": [5, 8]},
-                {"a": [1, 3], "b": [6, 7]},
-                {"a": [1, 3], "b": [6, 8]},
-                {"a": [1, 4], "b": [5, 7]},
-                {"a": [1, 4], "b": [5, 8]},
-                {"a": [1, 4], "b": [6, 7]},
-                {"a": [1, 4], "b": [6, 8]},
-                {"a": [2, 3], "b": [5, 7]},
-                {"a": [2, 3], "b": [5, 8]},
-                {"a": [2, 3], "b": [6, 7]},
-                {"a": [2, 3], "b": [6, 8]},
-                {"a": [2, 4], "b": [5, 7]},
-                {"a": [2, 4], "b": [5, 8]},
-                {"a": [2, 4], "b": [6, 7]},
-                {"a": [2, 4], "b": [6, 8]},
-            ]
+        pytest.param({}, {}, transform, id="trivial"),
+        pytest.param(
+            [Versions([1, 2])],
+            Versions([[1], [2]]),
+            identity,
+            id="merging_versions_simple",
         ),
-        fn=lambda x: x,
-    )
-
-
-def test_recursive_apply_merging_versions_list_in_list():
-    compare_recursive_apply(
-        node=[
+        pytest.param(
             [Versions([1, 2]), Versions([3, 4])],
-            [Versions([5, 6]), Versions([7, 8])],
-        ],
-        expected=Versions(
+            Versions([[1, 3], [1, 4], [2, 3], [2, 4]]),
+            identity,
+            id="merging_versions_list",
+        ),
+        pytest.param(
+            {"a": Versions([1, 2]), "b": Versions([3, 4])},
+            Versions(
+                [
+                    {"a": 1, "b": 3},
+                    {"a": 1, "b": 4},
+                    {"a": 2, "b": 3},
+                    {"a": 2, "b": 4},
+                ]
+            ),
+            identity,
+            id="merging_versions_dict",
+        ),
+        pytest.param(
+            {
+                "a": [Versions([1, 2]), Versions([3, 4])],
+                "b": [Versions([5, 6]), Versions([7, 8])],
+            },
+            Versions(
+                [
+                    {"a": [a, b], "b": [c, d]}
+                    for a, b, c, d in itertools.product(
+                        [1, 2], [3, 4], [5, 6], [7, 8]
+                    )
+                ]
+            ),
+            identity,
+            id="merging_versions_list_in_dict",
+        ),
+        pytest.param(
             [
-                [[1, 3], [5, 7]],
-                [[1, 3], [5, 8]],
-                [[1, 3], [6, 7]],
-                [[1, 3], [6, 8]],
-                [[1, 4], [5, 7]],
-                [[1, 4], [5, 8]],
-                [[1, 4], [6, 7]],
-                [[1, 4], [6, 8]],
-                [[2, 3], [5, 7]],
-                [[2, 3], [5, 8]],
-                [[2, 3], [6, 7]],
-                [[2, 3], [6, 8]],
-                [[2, 4], [5, 7]],
-                [[2, 4], [5, 8]],
-                [[2, 4], [6, 7]],
-                [[2, 4], [6, 8]],
-            ]
+                [Versions([1, 2]), Versions([3, 4])],
+                [Versions([5, 6]), Versions([7, 8])],
+            ],
+            Versions(
+                [
+                    [[a, b], [c, d]]
+                    for a, b, c, d in itertools.product(
+                        [1, 2], [3, 4], [5, 6], [7, 8]
+                    )
+                ]
+            ),
+            identity,
+            id="merging_versions_list_in_list",
+        ),
+        pytest.param(
+            {"a": {"b": Versions([1, 2])}, "c": Versions([2, 3])},
+            Versions(
+                [
+                    {"a": {"b": 1}, "c": 2},
+                    {"a": {"b": 1}, "c": 3},
+                    {"a": {"b": 2}, "c": 2},
+                    {"a": {"b": 2}, "c": 3},
+                ]
+            ),
+            identity,
+            id="merging_versions_dict_in_dict",
+        ),
+        pytest.param(
+            {
+                "my_list": [
+                    {"hello": "there"},
+                    {"a": {"version": [1, 2]}},
+                    {"b": {"version": [3, 4]}},
+                ]
+            },
+            Versions(
+                [
+                    {"my_list": [{"hello": "there"}, {"a": 1}, {"b": 3}]},
+                    {"my_list": [{"hello": "there"}, {"a": 1}, {"b": 4}]},
+                    {"my_list": [{"hello": "there"}, {"a": 2}, {"b": 3}]},
+                    {"my_list": [{"hello": "there"}, {"a": 2}, {"b": 4}]},
+                ]
+            ),
+            transform,
+            id="merging_versions_with_function",
         ),
-        fn=lambda x: x,
-    )
+        pytest.param(
+            {1: Versions([1, 2]), 2: "static"},
+            Versions([{1: 1, 2: "static"}, {1: 2, 2: "static"}]),
+            identity,
+            id="merging_versions_non_string_keys",
+        ),
+        pytest.param(
+            {"a": Versions([{"double": 1}, {"double": 2}])},
+            Versions([{"a": {"double": 1}}, {"a": {"double": 2}}]),
+            transform,
+            id="does_not_traverse_versions",
+        ),
+    ],
+)
+def test_recursive_apply(node, expected, fn):
+    assert recursive_apply(node, fn) == expected
 
 
-def test_recursive_apply_merging_versions_dict_in_dict():
-    compare_recursive_apply(
-        node={"a": {"b": Versions([1, 2])}, "c": Versions([2, 3])},
-        expected=Versions(
-            [
-                {"a": {"b": 1}, "c": 2},
-                {"a": {"b": 1}, "c": 3},
-                {"a": {"b": 2}, "c": 2},
-                {"a": {"b": 2}, "c": 3},
-            ]
-        ),
-        fn=lambda x: x,
-    )
+def test_recursive_apply_deeply_nested():
+    node = leaf = {}
+    for _ in range(5000):
+        leaf["a"] = {}
+        leaf = leaf["a"]
+    leaf["double"] = 1
 
+    result = recursive_apply(node, transform)
+    for _ in range(4999):
+        result = result["a"]
+    assert result == {"a": 2}
 
-def test_recursive_apply_merging_versions_with_function():
-    compare_recursive_apply(
-        node={
-            "my_list": [
-                {"hello": "there"},
-                {"a": {"version": [1, 2]}},
-                {"b": {"version": [3, 4]}},
-            ]
-        },
-        expected=Versions(
-            [
-                {"my_list": [{"hello": "there"}, {"a": 1}, {"b": 3}]},
-                {"my_list": [{"hello": "there"}, {"a": 1}, {"b": 4}]},
-                {"my_list": [{"hello": "there"}, {"a": 2}, {"b": 3}]},
-                {"my_list": [{"hello": "there"}, {"a": 2}, {"b": 4}]},
-            ]
-        ),
-    )
+
+def test_versions_not_equal_to_list():
+    assert Versions([1, 2]) != [1, 2]
+    assert Versions([1, 2]) == Versions([1, 2])
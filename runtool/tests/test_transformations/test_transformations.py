@@ -1,3 +1,5 @@
+import pytest
+
 from runtool.recurse_config import Versions
 from runtool.transformations import (
     apply_each,
@@ -10,90 +12,105 @@ from runtool.transformations import (
 )
 
 
-def compare_apply_from(node, data, expected):
-    assert apply_from(node, data) == expected
-
-
-def compare_apply_ref(node, context, expected):
-    assert apply_ref(node, context) == expected
-
-
-def compare_apply_trial(text, locals, expected):
-    assert apply_trial(text, locals) == expected
-
-
-def compare_apply_each(node, expected):
-    assert apply_each(node) == expected
-
-
-def test_apply_from_simple():
-    compare_apply_from(
-        node={
-            "$from": "b",
-            "some_key": "some_value",
-        },
-        data={
-            "b": {
-                "a": {"hello": "world"},
-            },
-        },
-        expected={
-            "a": {"hello": "world"},
-            "some_key": "some_value",
-        },
-    )
-
-
-def test_apply_from_empty():
-    compare_apply_from(
-        node={
-            "$from": "b",
-            "some_key": "some_value",
-        },
-        data={
-            "b": {},
-        },
-        expected={
-            "some_key": "some_value",
-        },
-    )
-
-
-def test_apply_from_with_path():
-    compare_apply_from(
-        node={
-            "$from": "b.c.0",
-            "some_key": "some_value",
-        },
-        data={
-            "b": {
-                "c": [{"hello": "world"}],
-            },
-        },
-        expected={
-            "hello": "world",
-            "some_key": "some_value",
-        },
-    )
-
-
-def test_apply_ref_simple():
-    compare_apply_ref(
-        node={"$ref": "a"},
-        context={"target": 1, "a": "hello"},
-        expected="hello",
-    )
-
-
-def test_apply_ref_nested():
-    compare_apply_ref(
-        node={"$ref": "a.0.b"},
-        context={
-            "target": 1,
-            "a": [{"b": {"$ref": "target"}}, "ignored"],
-        },
-        expected=1,
-    )
+@pytest.mark.parametrize(
+    "fn, args, expected",
+    [
+        pytest.param(
+            apply_from,
+            (
+                {"$from": "b", "some_key": "some_value"},
+                {"b": {"a": {"hello": "world"}}},
+            ),
+            {"a": {"hello": "world"}, "some_key": "some_value"},
+            id="apply_from_simple",
+        ),
+        pytest.param(
+            apply_from,
+            ({"$from": "b", "some_key": "some_value"}, {"b": {}}),
+            {"some_key": "some_value"},
+            id="apply_from_empty",
+        ),
+        pytest.param(
+            apply_from,
+            (
+                {"$from": "b.c.0", "some_key": "some_value"},
+                {"b": {"c": [{"hello": "world"}]}},
+            ),
+            {"hello": "world", "some_key": "some_value"},
+            id="apply_from_with_path",
+        ),
+        pytest.param(
+            apply_ref,
+            ({"$ref": "a"}, {"target": 1, "a": "hello"}),
+            "hello",
+            id="apply_ref_simple",
+        ),
+        pytest.param(
+            apply_ref,
+            (
+                {"$ref": "a.0.b"},
+                {"target": 1, "a": [{"b": {"$ref": "target"}}, "ignored"]},
+            ),
+            1,
+            id="apply_ref_nested",
+        ),
+        pytest.param(
+            apply_eval,
+            ({"$eval": "2 + 2"}, {}),
+            4,
+            id="apply_eval_simple",
+        ),
+        pytest.param(
+            apply_eval,
+            ({"$eval": "2 + 5 * $.value"}, {"value": 2}),
+            12,
+            id="apply_eval_referencing_locals",
+        ),
+        pytest.param(
+            apply_eval,
+            ({"$eval": "$trial.algorithm.some_value * 2"}, {}),
+            {"$eval": "__trial__.algorithm.some_value * 2"},
+            id="apply_eval_with_trial",
+        ),
+        pytest.param(
+            apply_eval,
+            (
+                {"$eval": "$trial.algorithm.some_value * $.some_value"},
+                {"some_value": 2},
+            ),
+            {"$eval": "__trial__.algorithm.some_value * 2"},
+            id="apply_eval_with_trial_and_dollar",
+        ),
+        pytest.param(
+            apply_trial,
+            (
+                {"$eval": "2 + __trial__.something[0]"},
+                {"__trial__": {"something": [1, 2, 3]}},
+            ),
+            3,
+            id="apply_trial_simple",
+        ),
+        pytest.param(
+            apply_each,
+            ({"$each": [1, 2, 3]},),
+            Versions([1, 2, 3]),
+            id="apply_each_simple",
+        ),
+        pytest.param(
+            apply_each,
+            ({"c": "dummy", "$each": ["$None", {"a": 150, "b": 64}]},),
+            Versions(
+                [
+                    {"c": "dummy"},
+                    {"a": 150, "b": 64, "c": "dummy"},
+                ]
+            ),
+            id="apply_each_with_none",
+        ),
+    ],
+)
+def test_apply(fn, args, expected):
+    assert fn(*args) == expected
 
 
 def test_evaluate():
@@ -130,70 +147,9 @@ def test_recurse_eval():
     )
 
 
-def compare_apply_eval(text, locals, expected):
-    assert apply_eval(text, locals) == expected
-
-
-def test_apply_eval_simple():
-    compare_apply_eval(
-        text={"$eval": "2 + 2"},
-        locals={},
-        expected=4,
-    )
-
-
-def test_apply_eval_referencing_locals():
-    compare_apply_eval(
-        text={"$eval": "2 + 5 * $.value"},
-        locals={"value": 2},
-        expected=12,
-    )
-
-
-def test_apply_eval_with_trial():
-    compare_apply_eval(
-        text={"$eval": "$trial.algorithm.some_value * 2"},
-        locals={},
-        expected={"$eval": "__trial__.algorithm.some_value * 2"},
-    )
-
-
-def test_apply_eval_with_trial_and_dollar():
-    compare_apply_eval(
-        text={"$eval": "$trial.algorithm.some_value * $.some_value"},
-        locals={"some_value": 2},
-        expected={"$eval": "__trial__.algorithm.some_value * 2"},
-    )
-
-
-def test_apply_trial_simple():
-    compare_apply_trial(
-        text={"$eval": "2 + __trial__.something[0]"},
-        locals={"__trial__": {"something": [1, 2, 3]}},
-        expected=3,
-    )
-
-
-def test_apply_each_simple():
-    compare_apply_each(
-        node={"$each": [1, 2, 3]},
-        expected=Versions([1, 2, 3]),
-    )
-
-
-def test_apply_each_with_none():
-    compare_apply_each(
-        node={
-            "c": "dummy",
-            "$each": [
-                "$None",
-                {"a": 150, "b": 64},
-            ],
-        },
-        expected=Versions(
-            [
-                {"c": "dummy"},
-                {"a": 150, "b": 64, "c": "dummy"},
-            ]
-        ),
-    )
+def test_recurse_eval_stops_at_missing_item():
+    assert recurse_eval(
+        path="a.b[3].c",
+        data={"a": {"b": [1, 2]}},
+        fn=lambda node, context: node,
+    ) == ("a.b", [1, 2])
@@ -1,3 +1,4 @@
+import pytest
 from runtool.utils import get_item_from_path, update_nested_dict
 
 
@@ -61,6 +62,20 @@ def test_updated_nested_dict_complex_reversed():
     )
 
 
+def test_updated_nested_dict_deeply_nested():
+    to_update = leaf = {}
+    for _ in range(5000):
+        leaf["a"] = {}
+        leaf = leaf["a"]
+    leaf["b"] = 1
+
+    result = update_nested_dict({"c": 2}, to_update)
+    assert result["c"] == 2
+    for _ in range(5000):
+        result = result["a"]
+    assert result == {"b": 1}
+
+
 def compare_get_item_from_path(data, path, expected):
     assert get_item_from_path(data, path) == expected
 
@@ -79,3 +94,16 @@ def test_get_item_from_path_medium():
         path="hello.3.there",
         expected="world",
     )
+
+
+def test_get_item_from_path_digit_dict_key():
+    compare_get_item_from_path(
+        data={"hello": {"0": "zero"}},
+        path="hello.0",
+        expected="zero",
+    )
+
+
+def test_get_item_from_path_non_numeric_list_index():
+    with pytest.raises(ValueError):
+        get_item_from_path({"hello": [1, 2, 3]}, "hello.there")